@@ -7,6 +7,7 @@ import (
 	"time"
 
 	"github.com/hyperledger/fabric-contract-api-go/contractapi"
+	"github.com/hyperledger/fabric-protos-go/ledger/queryresult"
 )
 
 type ChainOfCustodyContract struct {
@@ -33,6 +34,11 @@ type CustodyTransfer struct {
 	TransferredBy string `json:"transferred_by"`
 }
 
+type HistoryPage struct {
+	Items    []map[string]interface{} `json:"items"`
+	Bookmark string                   `json:"bookmark"`
+}
+
 
 func (c *ChainOfCustodyContract) InitLedger(ctx contractapi.TransactionContextInterface) error {
 	evidences := []Evidence{
@@ -197,25 +203,140 @@ func (c *ChainOfCustodyContract) GetEvidenceHistory(ctx contractapi.TransactionC
 			return nil, err
 		}
 
-		var evidence Evidence
-		if len(response.Value) > 0 {
-			err = json.Unmarshal(response.Value, &evidence)
-			if err != nil {
-				return nil, err
+		record, err := historyRecord(response)
+		if err != nil {
+			return nil, err
+		}
+
+		history = append(history, record)
+	}
+
+	labelHistory(history, nil)
+
+	return history, nil
+}
+
+// GetHistoryForAll returns the history of every given evidence ID, keyed by ID,
+// so a caller needing many histories makes one query instead of one per ID.
+func (c *ChainOfCustodyContract) GetHistoryForAll(ctx contractapi.TransactionContextInterface, ids []string) (map[string][]map[string]interface{}, error) {
+	histories := make(map[string][]map[string]interface{}, len(ids))
+
+	for _, id := range ids {
+		if id == "" {
+			continue
+		}
+
+		history, err := c.GetEvidenceHistory(ctx, id)
+		if err != nil {
+			return nil, err
+		}
+
+		histories[id] = history
+	}
+
+	return histories, nil
+}
+
+// GetEvidenceHistoryPage returns at most pageSize history records starting at the
+// opaque bookmark ("" for the first page). An empty bookmark in the result means
+// there are no further pages. The bookmark is the txId of the next page's first
+// record, so writes committed between page queries cannot shift the page boundary.
+func (c *ChainOfCustodyContract) GetEvidenceHistoryPage(ctx contractapi.TransactionContextInterface, id string, bookmark string, pageSize int32) (*HistoryPage, error) {
+	if pageSize <= 0 {
+		return nil, fmt.Errorf("page size must be positive")
+	}
+
+	resultsIterator, err := ctx.GetStub().GetHistoryForKey(id)
+	if err != nil {
+		return nil, err
+	}
+	defer resultsIterator.Close()
+
+	page := &HistoryPage{Items: []map[string]interface{}{}}
+	var next map[string]interface{}
+	found := bookmark == ""
+
+	for resultsIterator.HasNext() {
+		response, err := resultsIterator.Next()
+		if err != nil {
+			return nil, err
+		}
+
+		// Records before the bookmark are skipped without decoding their values
+		if !found {
+			if response.TxId != bookmark {
+				continue
 			}
+			found = true
 		}
 
-		record := map[string]interface{}{
-			"txId":      response.TxId,
-			"timestamp": response.Timestamp,
-			"isDelete":  response.IsDelete,
-			"evidence":  evidence,
+		record, err := historyRecord(response)
+		if err != nil {
+			return nil, err
 		}
 
-		history = append(history, record)
+		if len(page.Items) == int(pageSize) {
+			page.Bookmark = response.TxId
+			// The first record of the next page decides the action of this page's last one
+			next = record
+			break
+		}
+
+		page.Items = append(page.Items, record)
 	}
 
-	return history, nil
+	if !found {
+		return nil, fmt.Errorf("invalid bookmark %q", bookmark)
+	}
+
+	labelHistory(page.Items, next)
+
+	return page, nil
+}
+
+func historyRecord(response *queryresult.KeyModification) (map[string]interface{}, error) {
+	var evidence Evidence
+	if len(response.Value) > 0 {
+		err := json.Unmarshal(response.Value, &evidence)
+		if err != nil {
+			return nil, err
+		}
+	}
+
+	return map[string]interface{}{
+		"txId":      response.TxId,
+		"timestamp": response.Timestamp,
+		"isDelete":  response.IsDelete,
+		"evidence":  evidence,
+	}, nil
+}
+
+// labelHistory sets the "action" of each record in a newest-first history slice.
+// next is the record that follows the slice's last one, or nil if it is the oldest.
+func labelHistory(history []map[string]interface{}, next map[string]interface{}) {
+	for i, record := range history {
+		older := next
+		if i+1 < len(history) {
+			older = history[i+1]
+		}
+		record["action"] = historyAction(record, older)
+	}
+}
+
+func historyAction(record map[string]interface{}, older map[string]interface{}) string {
+	if record["isDelete"].(bool) {
+		return "DELETED"
+	}
+
+	evidence := record["evidence"].(Evidence)
+	if evidence.CreatedAt == evidence.UpdatedAt {
+		return "CREATED"
+	}
+	if older != nil && older["evidence"].(Evidence).Owner != evidence.Owner {
+		return "TRANSFERRED"
+	}
+
+	return "UPDATED"
 }
 
 func (c *ChainOfCustodyContract) GetAllEvidence(ctx contractapi.TransactionContextInterface) ([]*Evidence, error) {
@@ -2,7 +2,10 @@ module github.com/chainofcustody/chaincode
 
 go 1.20
 
-require github.com/hyperledger/fabric-contract-api-go v1.2.1
+require (
+	github.com/hyperledger/fabric-contract-api-go v1.2.1
+	github.com/hyperledger/fabric-protos-go v0.3.0
+)
 
 require (
 	github.com/go-openapi/jsonpointer v0.19.5 // indirect
@@ -14,7 +17,6 @@ require (
 	github.com/gobuffalo/packr v1.30.1 // indirect
 	github.com/golang/protobuf v1.5.3 // indirect
 	github.com/hyperledger/fabric-chaincode-go v0.0.0-20230228194215-b84622ba6a7a // indirect
-	github.com/hyperledger/fabric-protos-go v0.3.0 // indirect
 	github.com/joho/godotenv v1.5.1 // indirect
 	github.com/josharian/intern v1.0.0 // indirect
 	github.com/mailru/easyjson v0.7.7 // indirect
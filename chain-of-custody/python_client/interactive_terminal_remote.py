@@ -1,56 +1,141 @@
 #!/usr/bin/env python3
+import functools
+import operator
 import subprocess
 import json
+import logging
 import os
 import sys
 import re
-from typing import List, Dict, Optional
+import shutil
+from typing import Iterator, List, Dict, Mapping, Optional, Sequence, Tuple
 import time
+import types
 import uuid
 import datetime
 import base64
 import binascii
+import csv
+import copy
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    _json_loads = json.loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+logger = logging.getLogger(__name__)
 
 ORG_DISPLAY_NAMES = {
     "org1": "Police Department",
     "org2": "Forensics Lab"
 }
 
+# Short org name -> (peer port, MSP ID)
+ORG_CONFIG = {
+    "org1": ("7051", "Org1MSP"),
+    "org2": ("9051", "Org2MSP")
+}
+
 FABRIC_BASE_PATH = os.path.expanduser("~/blockchain-projects/fabric-samples/test-network")
 
+ORDERER_ADDRESS = "orderer.example.com:7050"
+ORDERER_TLS_HOSTNAME = "orderer.example.com"
+ORG1_PEER_ADDRESS = "peer0.org1.example.com:7051"
+ORG2_PEER_ADDRESS = "peer0.org2.example.com:9051"
+
+# Chaincode function names are plain identifiers, so only the argument list needs a JSON encode
+_CALL_TEMPLATE = '{"function":"%s","Args":%s}'
+
+def _encode_call(function_name: str, args_list: List[str]) -> str:
+    return _CALL_TEMPLATE % (function_name, _json_dumps(args_list))
+
+# Bulk CSV import submits this many creates per batch
+BULK_IMPORT_CHUNK_SIZE = 32
+
+# IDs per GetHistoryForAll call; keeps the JSON argv well under Linux's 128 KiB per-argument
+# limit and bounds the size of each response
+HISTORY_BATCH_SIZE = 200
+
+# Box-drawing pieces shared by the history and ledger printers
+BOX_HR = "─" * 66
+ZERO_HASH = "0" * 52
+
+# Box cells hold 52 characters; longer values are cut to fit with a trailing "..."
+def _trunc(text: str, width: int = 50) -> str:
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+def _field(record: Dict, key: str, width: int = 50) -> str:
+    return _trunc(record.get(key, 'N/A'), width)
+
+# Shared by every client for parallel peer CLI fan-out; the work is subprocess I/O, so threads suffice
+_EXECUTOR = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+
+# Directory scans are memoized on the directory's mtime, so a rescan only happens when entries change
+@functools.lru_cache(maxsize=16)
+def _scan_orgs(orgs_path: str, mtime_ns: int) -> Dict[str, str]:
+    with os.scandir(orgs_path) as entries:
+        return {entry.name.partition('.')[0]: entry.name for entry in entries if entry.is_dir()}
+
+@functools.lru_cache(maxsize=16)
+def _scan_users(users_path: str, mtime_ns: int) -> Tuple[str, ...]:
+    with os.scandir(users_path) as entries:
+        return tuple(sorted(entry.name.partition('@')[0] for entry in entries if entry.is_dir()))
+
 def get_available_orgs(base_path: str) -> Dict[str, str]:
     orgs_path = os.path.join(base_path, "organizations", "peerOrganizations")
     
-    if not os.path.exists(orgs_path):
+    # Missing, unreadable or not-a-directory paths all mean "no orgs"
+    try:
+        return dict(_scan_orgs(orgs_path, os.stat(orgs_path).st_mtime_ns))
+    except OSError:
         return {}
 
-    found_orgs = {}
-    for item in os.listdir(orgs_path):
-        full_path = os.path.join(orgs_path, item)
-        if os.path.isdir(full_path):
-            short_name = item.split('.')[0]
-            found_orgs[short_name] = item
-            
-    return found_orgs
-
 def get_available_users(base_path: str, org_domain: str) -> List[str]:
     users_path = os.path.join(base_path, "organizations", "peerOrganizations", org_domain, "users")
     
-    if not os.path.exists(users_path):
+    try:
+        return list(_scan_users(users_path, os.stat(users_path).st_mtime_ns))
+    except OSError:
         return []
 
-    users = []
-    for item in os.listdir(users_path):
-        full_path = os.path.join(users_path, item)
-        if os.path.isdir(full_path):
-            username = item.split('@')[0]
-            users.append(username)
-    
-    return sorted(users)
+
+# Raised when a peer or configtxlator command exits non-zero; the message is its stderr
+class PeerError(Exception):
+    pass
 
 
 class ChainOfCustodyClient:
-    def __init__(self, org_name, org_domain, username):
+    fabric_path: str
+    channel: str
+    chaincode: str
+    org_name: str
+    org_domain: str
+    username: str
+    friendly_name: str
+    peer_port: str
+    msp_id: str
+    user_msp_dir: str
+    env: Mapping[str, str]
+    orderer_ca: str
+    org1_tls_ca: str
+    org2_tls_ca: str
+
+    def __init__(self, org_name: str, org_domain: str, username: str, cache_ttl: float = 1.0):
         self.fabric_path = FABRIC_BASE_PATH
         self.channel = "mychannel"
         self.chaincode = "chainofcustody"
@@ -60,132 +145,254 @@ class ChainOfCustodyClient:
         
         self.friendly_name = ORG_DISPLAY_NAMES.get(org_name, org_name)
 
-        if "org1" in org_name:
-            self.peer_port = "7051"
-            self.msp_id = "Org1MSP"
-        elif "org2" in org_name:
-            self.peer_port = "9051"
-            self.msp_id = "Org2MSP"
-        else:
-            print(f"Warning: Unknown port for {org_name}, defaulting to 7051")
-            self.peer_port = "7051"
-            self.msp_id = "Org1MSP"
+        # Query results keyed by (function, args): (time.monotonic() when fetched, data).
+        # Our own invokes clear it; the short TTL bounds how stale writes from the other org can look.
+        # Cached objects are shared with every caller, so callers must not mutate them.
+        self._cache: Dict[Tuple[str, Tuple[str, ...]], Tuple[float, object]] = {}
+        self._cache_ttl = cache_ttl
+
+        # Block 0 never changes for the life of the channel
+        self._genesis_info: Optional[Dict] = None
+
+        # Last ledger view: (channel height, sorted transactions, evidence count); dropped on any invoke
+        self._ledger_cache: Optional[Tuple[int, List[Dict], int]] = None
+
+        # Invokes queued with batch=True, submitted together by flush_batch()
+        self._pending: List[Tuple[str, List[str]]] = []
+
+        # Bumped by every invoke; query results fetched under an older generation are never cached or shown
+        self._generation = 0
 
-        self.user_msp_dir = f"{self.fabric_path}/organizations/peerOrganizations/{self.org_domain}/users/{self.username}@{self.org_domain}/msp"
+        # GetAllEvidence peer process started while the menu waits for input: (generation, process).
+        # Only an immediate "Get All" may use it; main() discards it on any other choice.
+        self._all_evidence_proc: Optional[Tuple[int, subprocess.Popen]] = None
+
+        if org_name not in ORG_CONFIG:
+            logger.warning("Warning: Unknown port for %s, defaulting to 7051", org_name)
+        self.peer_port, self.msp_id = ORG_CONFIG.get(org_name, ORG_CONFIG["org1"])
+
+        peer_orgs_root = f"{self.fabric_path}/organizations/peerOrganizations"
+        self._peer_org_root = f"{peer_orgs_root}/{self.org_domain}"
+        self._orderer_org_root = f"{self.fabric_path}/organizations/ordererOrganizations/example.com"
+
+        self.user_msp_dir = f"{self._peer_org_root}/users/{self.username}@{self.org_domain}/msp"
         
         if not os.path.exists(self.user_msp_dir):
             raise ValueError(f"MSP directory not found for {username} at {self.user_msp_dir}")
 
-        self.env = os.environ.copy()
-        self.env["PATH"] = f"{self.fabric_path}/../bin:{self.env.get('PATH', '')}"
-        self.env["FABRIC_CFG_PATH"] = f"{self.fabric_path}/../config/"
-        self.env["CORE_PEER_TLS_ENABLED"] = "true"
-        self.env["CORE_PEER_LOCALMSPID"] = self.msp_id
-        self.env["CORE_PEER_TLS_ROOTCERT_FILE"] = f"{self.fabric_path}/organizations/peerOrganizations/{self.org_domain}/peers/peer0.{self.org_domain}/tls/ca.crt"
-        self.env["CORE_PEER_MSPCONFIGPATH"] = self.user_msp_dir
-        self.env["CORE_PEER_ADDRESS"] = f"peer0.{self.org_domain}:{self.peer_port}"
+        self.env = self._build_env(
+            self.fabric_path,
+            self.msp_id,
+            f"{self._peer_org_root}/peers/peer0.{self.org_domain}/tls/ca.crt",
+            self.user_msp_dir,
+            f"peer0.{self.org_domain}:{self.peer_port}",
+        )
         
-        self.orderer_ca = f"{self.fabric_path}/organizations/ordererOrganizations/example.com/orderers/orderer.example.com/msp/tlscacerts/tlsca.example.com-cert.pem"
-        self.org1_tls_ca = f"{self.fabric_path}/organizations/peerOrganizations/org1.example.com/peers/peer0.org1.example.com/tls/ca.crt"
-        self.org2_tls_ca = f"{self.fabric_path}/organizations/peerOrganizations/org2.example.com/peers/peer0.org2.example.com/tls/ca.crt"
-
-    def _run_peer_command(self, args: List[str], parse_json: bool = False) -> Dict:
-        try:
-            result = subprocess.run(
-                args, env=self.env, capture_output=True, text=True, check=True
-            )
-            if parse_json and result.stdout:
-                try:
-                    return {"success": True, "data": json.loads(result.stdout)}
-                except json.JSONDecodeError:
-                    return {"success": True, "data": result.stdout, "raw": True}
-            return {"success": True, "output": result.stdout, "error": result.stderr}
-        except subprocess.CalledProcessError as e:
-            err_msg = e.stderr or str(e)
-            if "access denied" in err_msg:
-                return {"success": False, "error": "ACCESS DENIED: User does not have permission."}
-            return {"success": False, "error": err_msg}
-
-    def invoke_transaction(self, function_name: str, args_list: List[str]) -> Dict:
-        cmd_args = [
-            "peer", "chaincode", "invoke",
-            "-o", "orderer.example.com:7050",
-            "--ordererTLSHostnameOverride", "orderer.example.com",
+        self.orderer_ca = f"{self._orderer_org_root}/orderers/orderer.example.com/msp/tlscacerts/tlsca.example.com-cert.pem"
+        self.org1_tls_ca = f"{peer_orgs_root}/org1.example.com/peers/peer0.org1.example.com/tls/ca.crt"
+        self.org2_tls_ca = f"{peer_orgs_root}/org2.example.com/peers/peer0.org2.example.com/tls/ca.crt"
+
+        # Resolved once: an absolute executable lets subprocess use posix_spawn instead of fork+exec
+        self._peer_bin = shutil.which("peer", path=self.env["PATH"]) or "peer"
+
+        # Everything but the "-c" payload is fixed per client, so build it once
+        # Tuples: immutable, and the literals/constants in them are shared rather than rebuilt per call
+        self._invoke_argv_prefix: Tuple[str, ...] = (
+            self._peer_bin, "chaincode", "invoke",
+            "-o", ORDERER_ADDRESS,
+            "--ordererTLSHostnameOverride", ORDERER_TLS_HOSTNAME,
             "--tls", "--cafile", self.orderer_ca,
             "-C", self.channel, "-n", self.chaincode,
-            "--peerAddresses", "peer0.org1.example.com:7051", "--tlsRootCertFiles", self.org1_tls_ca,
-            "--peerAddresses", "peer0.org2.example.com:9051", "--tlsRootCertFiles", self.org2_tls_ca,
-            "-c", json.dumps({"function": function_name, "Args": args_list})
-        ]
-        return self._run_peer_command(cmd_args)
+            "--peerAddresses", ORG1_PEER_ADDRESS, "--tlsRootCertFiles", self.org1_tls_ca,
+            "--peerAddresses", ORG2_PEER_ADDRESS, "--tlsRootCertFiles", self.org2_tls_ca,
+            "--waitForEvent",
+        )
+        self._query_argv_prefix: Tuple[str, ...] = (
+            self._peer_bin, "chaincode", "query",
+            "-C", self.channel, "-n", self.chaincode,
+        )
+        # Shared tail of every `peer channel fetch/update` against the orderer
+        self._channel_orderer_args: Tuple[str, ...] = (
+            "-o", ORDERER_ADDRESS,
+            "--ordererTLSHostnameOverride", ORDERER_TLS_HOSTNAME,
+            "--tls", "--cafile", self.orderer_ca,
+            "-c", self.channel,
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _build_env(fabric_path: str, msp_id: str, tls_rootcert_file: str, msp_config_path: str, peer_address: str) -> Mapping[str, str]:
+        # Shared by every client for the same identity; read-only because subprocess only reads it.
+        # Only what peer/configtxlator need is passed, not a copy of this process's whole environment.
+        env = {
+            "PATH": f"{fabric_path}/../bin:{os.environ.get('PATH', '')}",
+            "FABRIC_CFG_PATH": f"{fabric_path}/../config/",
+            "CORE_PEER_TLS_ENABLED": "true",
+            "CORE_PEER_LOCALMSPID": msp_id,
+            "CORE_PEER_TLS_ROOTCERT_FILE": tls_rootcert_file,
+            "CORE_PEER_MSPCONFIGPATH": msp_config_path,
+            "CORE_PEER_ADDRESS": peer_address,
+        }
+        if "HOME" in os.environ:
+            env["HOME"] = os.environ["HOME"]
+        return types.MappingProxyType(env)
+
+    def _run_peer_command(self, args: Sequence[str], env: Optional[Mapping[str, str]] = None) -> bytes:
+        # Returns the command's raw stdout; a non-zero exit raises PeerError carrying its stderr.
+        # Binary pipes: JSON responses are parsed straight from bytes, skipping a decode pass.
+        # close_fds=False (plus an absolute args[0], no preexec_fn/cwd) keeps CPython on its
+        # posix_spawn() fast path, avoiding a fork of this process's page tables per call.
+        try:
+            return subprocess.run(
+                args, env=env or self.env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, close_fds=False
+            ).stdout
+        except subprocess.CalledProcessError as e:
+            raise self._peer_error(e.stderr, str(e)) from None
+        except OSError as e:
+            # e.g. a missing binary, or an argv over the kernel's per-argument limit (E2BIG)
+            raise PeerError(str(e)) from None
+
+    @staticmethod
+    def _peer_error(stderr: Optional[bytes], fallback: str) -> PeerError:
+        err_msg = stderr.decode(errors="replace") if stderr else fallback
+        if "access denied" in err_msg:
+            err_msg = "ACCESS DENIED: User does not have permission."
+        return PeerError(err_msg)
+
+    def _invoke_args(self, function_name: str, args_list: List[str]) -> Tuple[str, ...]:
+        return self._invoke_argv_prefix + ("-c", _encode_call(function_name, args_list))
+
+    def _query_args(self, function_name: str, args_list: List[str]) -> Tuple[str, ...]:
+        return self._query_argv_prefix + ("-c", _encode_call(function_name, args_list))
+
+    def invoke_transaction(self, function_name: str, args_list: List[str], batch: bool = False) -> Dict:
+        if batch:
+            self._pending.append((function_name, args_list))
+            return {"success": True, "queued": True}
+        try:
+            self._run_peer_command(self._invoke_args(function_name, args_list))
+            result = {"success": True}
+        except PeerError as e:
+            result = {"success": False, "error": str(e)}
+        self._generation += 1
+        self._cache.clear()
+        self._ledger_cache = None
+        return result
+
+    def flush_batch(self) -> List[Dict]:
+        # Queued invokes are endorsed and ordered concurrently, so they can land in the same block
+        pending, self._pending = self._pending, []
+        return list(_EXECUTOR.map(lambda call: self.invoke_transaction(*call), pending))
+
+    def _query(self, function_name: str, args_list: List[str]) -> Optional[Dict]:
+        # Cached chaincode query; raises PeerError when the peer rejects it
+        key = (function_name, tuple(args_list))
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+        generation = self._generation
+        data = self._parse_query_output(self._run_peer_command(self._query_args(function_name, args_list)))
+        # An invoke that completed while this query was in flight may have made the result stale
+        if data is not None and generation == self._generation:
+            self._cache[key] = (time.monotonic(), data)
+        return data
+
+    @staticmethod
+    def _parse_query_output(output: bytes) -> Optional[Dict]:
+        if not output:
+            return None
+        try:
+            return _json_loads(output)
+        except ValueError:
+            return output.decode(errors="replace")
 
     def query_chaincode(self, function_name: str, args_list: List[str]) -> Optional[Dict]:
-        cmd_args = [
-            "peer", "chaincode", "query",
-            "-C", self.channel, "-n", self.chaincode,
-            "-c", json.dumps({"function": function_name, "Args": args_list})
-        ]
-        result = self._run_peer_command(cmd_args, parse_json=True)
-        return result.get("data") if result["success"] else None
+        try:
+            return self._query(function_name, args_list)
+        except PeerError:
+            return None
+
+    def _iter_history(self, ev_id: str, page_size: int = 500) -> Iterator[Dict]:
+        # Newest first, fetched one GetEvidenceHistoryPage at a time so no single response grows unbounded;
+        # raises PeerError if a page query fails
+        bookmark = ""
+        while True:
+            page = self._query("GetEvidenceHistoryPage", [ev_id, bookmark, str(page_size)])
+            if not isinstance(page, dict):
+                return
+            yield from page.get("items") or []
+            bookmark = page.get("bookmark", "")
+            if not bookmark:
+                return
+
+    def _get_histories(self, ev_ids: List[str]) -> List[List[Dict]]:
+        # One GetHistoryForAll query per HISTORY_BATCH_SIZE IDs; raises PeerError if any batch fails
+        histories = []
+        for start in range(0, len(ev_ids), HISTORY_BATCH_SIZE):
+            batch = ev_ids[start:start + HISTORY_BATCH_SIZE]
+            by_id = self._query("GetHistoryForAll", [_json_dumps(batch)])
+            if not isinstance(by_id, dict):
+                raise PeerError(f"Unexpected GetHistoryForAll response: {by_id!r}")
+            histories.extend(by_id.get(ev_id) or [] for ev_id in batch)
+        return histories
+
+    def _ledger_height(self) -> Optional[int]:
+        # `peer channel getinfo` prints "Blockchain info: {json}" with the channel's block height
+        try:
+            output = self._run_peer_command((self._peer_bin, "channel", "getinfo", "-c", self.channel))
+        except PeerError:
+            return None
+        _, _, info = output.partition(b"Blockchain info:")
+        try:
+            return int(_json_loads(info)["height"])
+        except (ValueError, KeyError, TypeError):
+            return None
 
     def get_genesis_block(self) -> Dict:
-        block_file = os.path.abspath("genesis.block")
-        json_file = os.path.abspath("genesis.json")
-        
-        if os.path.exists(block_file):
-            os.remove(block_file)
-        if os.path.exists(json_file):
-            os.remove(json_file)
-
-        # 1. Fetch Block 0
-        cmd_fetch = [
-            "peer", "channel", "fetch", "0", block_file,
-            "-o", "localhost:7050",
-            "--ordererTLSHostnameOverride", "orderer.example.com",
-            "--tls", "--cafile", self.orderer_ca,
-            "-c", self.channel
-        ]
-        
-        # We suppress output for fetch as it prints to stderr
-        self._run_peer_command(cmd_fetch)
-        
-        if not os.path.exists(block_file):
-            return {"timestamp": "Fetch Failed", "hash": "N/A"}
-
-        # 2. Decode with configtxlator
         configtxlator_path = os.path.normpath(os.path.join(self.fabric_path, "../bin/configtxlator"))
         
         if not os.path.exists(configtxlator_path):
-             print(f"ERROR: configtxlator not found at {configtxlator_path}")
+             logger.error("ERROR: configtxlator not found at %s", configtxlator_path)
              return {"timestamp": "Tool Missing", "hash": "N/A"}
 
-        cmd_decode = [
-            configtxlator_path, "proto_decode",
-            "--input", block_file,
-            "--type", "common.Block",
-            "--output", json_file
-        ]
-        
-        result = self._run_peer_command(cmd_decode)
-        
-        if os.path.exists(block_file):
-            os.remove(block_file)
+        cmd_decode = [configtxlator_path, "proto_decode", "--type", "common.Block"]
+
+        if os.name == 'nt':
+            # Windows has no /dev/stdout to fetch into, so block 0 goes through a temporary file
+            with tempfile.TemporaryDirectory() as workdir:
+                block_file = os.path.join(workdir, "genesis.block")
+                cmd_fetch = [self._peer_bin, "channel", "fetch", "0", block_file, *self._channel_orderer_args]
+                fetch_status = subprocess.run(cmd_fetch, env=self.env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode
+                if fetch_status != 0:
+                    return {"timestamp": "Fetch Failed", "hash": "N/A"}
+                decode = subprocess.run(cmd_decode + ["--input", block_file], env=self.env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        else:
+            # Block 0 is piped straight from the fetch into configtxlator (stdin -> stdout), never touching disk
+            cmd_fetch = [
+                self._peer_bin, "channel", "fetch", "0", "/dev/stdout", *self._channel_orderer_args
+            ]
 
-        if not result["success"]:
-            print(f"ERROR: configtxlator failed: {result.get('error')}")
-            if os.path.exists(json_file): os.remove(json_file)
+            # We suppress output for fetch as it prints to stderr
+            fetch = subprocess.Popen(cmd_fetch, env=self.env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, close_fds=False)
+            try:
+                decode = subprocess.run(cmd_decode, env=self.env, stdin=fetch.stdout, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=False)
+            finally:
+                fetch.stdout.close()
+                fetch_status = fetch.wait()
+
+            if fetch_status != 0:
+                return {"timestamp": "Fetch Failed", "hash": "N/A"}
+
+        if decode.returncode != 0:
+            logger.error("ERROR: configtxlator failed: %s", decode.stderr.decode(errors="replace"))
             return {"timestamp": "Decode Failed", "hash": "N/A"}
             
-        if not os.path.exists(json_file):
-            print("ERROR: configtxlator did not produce output file")
+        if not decode.stdout:
+            logger.error("ERROR: configtxlator produced no output")
             return {"timestamp": "No Output", "hash": "N/A"}
 
         try:
-            with open(json_file, 'r') as f:
-                block_data = json.load(f)
-            
-            if os.path.exists(json_file):
-                os.remove(json_file)
+            block_data = _json_loads(decode.stdout)
             
             # Extract Timestamp
             # Block -> data -> data[0] -> payload -> header -> channel_header -> timestamp
@@ -208,8 +415,8 @@ class ChainOfCustodyClient:
             
             # Convert Base64 to Hex
             try:
-                data_hash_hex = binascii.hexlify(base64.b64decode(data_hash_b64)).decode('utf-8')
-            except:
+                data_hash_hex = base64.b64decode(data_hash_b64).hex()
+            except (binascii.Error, ValueError):
                 data_hash_hex = data_hash_b64
 
             return {
@@ -217,25 +424,139 @@ class ChainOfCustodyClient:
                 "hash": data_hash_hex
             }
 
-        except json.JSONDecodeError:
-            if os.path.exists(json_file): os.remove(json_file)
+        except ValueError:
             return {"timestamp": "Parse Error", "hash": "N/A"}
         except Exception as e:
-            print(f"Error parsing genesis block: {e}")
-            if os.path.exists(json_file): os.remove(json_file)
+            logger.error("Error parsing genesis block: %s", e)
             return {"timestamp": "Error", "hash": "N/A"}
 
+    @staticmethod
+    def _print_result(result: Dict, success_msg: str):
+        print(success_msg if result["success"] else f"Failed: {result['error']}")
+
+    @staticmethod
+    def _new_evidence_args(description: str, owner: str, location: str, tags: List[str]) -> List[str]:
+        return [str(uuid.uuid4()), description, owner, location, _json_dumps(tags)]
+
+    def tune_orderer(self, batch_timeout: str = "250ms", max_message_count: int = 500) -> Dict:
+        # Commit latency on a quiet network is dominated by the orderer BatchTimeout (2s by default).
+        # Rewrites the channel's Orderer BatchTimeout/BatchSize through a signed config update.
+        configtxlator_path = os.path.normpath(os.path.join(self.fabric_path, "../bin/configtxlator"))
+        if not os.path.exists(configtxlator_path):
+            return {"success": False, "error": f"configtxlator not found at {configtxlator_path}"}
+
+        with tempfile.TemporaryDirectory() as workdir:
+            def path(name):
+                return os.path.join(workdir, name)
+
+            def configtxlator(*args):
+                return self._run_peer_command([configtxlator_path, *args])
+
+            try:
+                # 1. Fetch and decode the latest config block
+                self._run_peer_command([
+                    self._peer_bin, "channel", "fetch", "config", path("config_block.pb"), *self._channel_orderer_args
+                ])
+                block = configtxlator("proto_decode", "--input", path("config_block.pb"), "--type", "common.Block")
+
+                try:
+                    config = _json_loads(block)["data"]["data"][0]["payload"]["data"]["config"]
+                    values = config["channel_group"]["groups"]["Orderer"]["values"]
+                    current_timeout = values["BatchTimeout"]["value"]["timeout"]
+                    current_count = values["BatchSize"]["value"]["max_message_count"]
+                except (KeyError, IndexError, TypeError, ValueError):
+                    return {"success": False, "error": "Unexpected channel config layout"}
+
+                if current_timeout == batch_timeout and current_count == max_message_count:
+                    return {"success": True, "changed": False, "previous": current_timeout}
+
+                # 2. Patch a copy and let configtxlator compute the delta
+                updated = copy.deepcopy(config)
+                updated_values = updated["channel_group"]["groups"]["Orderer"]["values"]
+                updated_values["BatchTimeout"]["value"]["timeout"] = batch_timeout
+                updated_values["BatchSize"]["value"]["max_message_count"] = max_message_count
+
+                for name, doc in (("original", config), ("updated", updated)):
+                    with open(path(f"{name}.json"), "w") as f:
+                        json.dump(doc, f)
+                    configtxlator("proto_encode", "--input", path(f"{name}.json"), "--type", "common.Config", "--output", path(f"{name}.pb"))
+
+                configtxlator("compute_update", "--channel_id", self.channel,
+                              "--original", path("original.pb"), "--updated", path("updated.pb"),
+                              "--output", path("update.pb"))
+                config_update = _json_loads(configtxlator("proto_decode", "--input", path("update.pb"), "--type", "common.ConfigUpdate"))
+
+                # 3. Wrap in an envelope and submit it signed by the orderer admin
+                envelope = {
+                    "payload": {
+                        "header": {"channel_header": {"channel_id": self.channel, "type": 2}},
+                        "data": {"config_update": config_update}
+                    }
+                }
+                with open(path("envelope.json"), "w") as f:
+                    json.dump(envelope, f)
+                configtxlator("proto_encode", "--input", path("envelope.json"), "--type", "common.Envelope", "--output", path("envelope.pb"))
+
+                orderer_admin_env = self._build_env(
+                    self.fabric_path,
+                    "OrdererMSP",
+                    self.orderer_ca,
+                    f"{self._orderer_org_root}/users/Admin@example.com/msp",
+                    ORDERER_ADDRESS,
+                )
+                self._run_peer_command([
+                    self._peer_bin, "channel", "update", "-f", path("envelope.pb"), *self._channel_orderer_args
+                ], env=orderer_admin_env)
+            except PeerError as e:
+                return {"success": False, "error": str(e)}
+
+        return {"success": True, "changed": True, "previous": current_timeout}
+
     def create_evidence(self):
         print(f"\n--- Create New Evidence ({self.friendly_name}) ---")
         #ev_id = input("Evidence ID (e.g. EV001): ").strip()
-        ev_id = str(uuid.uuid4())
         desc = input("Description: ").strip()
         owner = input("Initial Owner Name: ").strip()
         loc = input("Location: ").strip()
         tags_input = input("Tags (comma separated): ").strip()
         tags = [t.strip() for t in tags_input.split(",") if t.strip()]
-        result = self.invoke_transaction("CreateEvidence", [ev_id, desc, owner, loc, json.dumps(tags)])
-        print("Evidence created!" if result["success"] else f"Failed: {result['error']}")
+        result = self.invoke_transaction("CreateEvidence", self._new_evidence_args(desc, owner, loc, tags))
+        self._print_result(result, "Evidence created!")
+
+    def create_evidence_many(self, rows: List[Dict]) -> List[Dict]:
+        # rows: [{"description", "owner", "location", "tags"}, ...]; the pool size caps endorser load
+        for row in rows:
+            self.invoke_transaction("CreateEvidence", self._new_evidence_args(**row), batch=True)
+        return self.flush_batch()
+
+    def bulk_import_csv(self):
+        print(f"\n--- Bulk Import from CSV ({self.friendly_name}) ---")
+        print("UTF-8 file; columns: description, owner, location, tags (tags comma separated)")
+        path = input("CSV File: ").strip()
+        try:
+            # utf-8-sig also strips the BOM Excel writes, which would otherwise hide the first header
+            with open(os.path.expanduser(path), newline="", encoding="utf-8-sig") as f:
+                rows = [
+                    {
+                        "description": (row.get("description") or "").strip(),
+                        "owner": (row.get("owner") or "").strip(),
+                        "location": (row.get("location") or "").strip(),
+                        "tags": [t.strip() for t in (row.get("tags") or "").split(",") if t.strip()],
+                    }
+                    for row in csv.DictReader(f)
+                ]
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            print(f"Failed: {e}")
+            return
+
+        created = 0
+        for start in range(0, len(rows), BULK_IMPORT_CHUNK_SIZE):
+            for result in self.create_evidence_many(rows[start:start + BULK_IMPORT_CHUNK_SIZE]):
+                if result["success"]:
+                    created += 1
+                else:
+                    print(f"Failed: {result['error']}")
+        print(f"Imported {created} of {len(rows)} evidence items.")
 
     def read_evidence(self):
         ev_id = input("\nEnter Evidence ID: ").strip()
@@ -250,7 +571,7 @@ class ChainOfCustodyClient:
         loc = input("New Loc: ").strip()
         status = input("New Status: ").strip()
         result = self.invoke_transaction("UpdateEvidence", [ev_id, desc, loc, status])
-        print("Updated!" if result["success"] else f"Failed: {result['error']}")
+        self._print_result(result, "Updated!")
 
     def transfer_custody(self):
         print(f"\n--- Transfer Custody ({self.friendly_name}) ---")
@@ -259,153 +580,205 @@ class ChainOfCustodyClient:
         reason = input("Reason: ").strip()
         by_whom = input("Transferred By: ").strip()
         result = self.invoke_transaction("TransferCustody", [ev_id, new_owner, reason, by_whom])
-        print("Transferred!" if result["success"] else f"Failed: {result['error']}")
+        self._print_result(result, "Transferred!")
 
     def get_history(self):
         ev_id = input("\nEnter ID for History: ").strip()
-        data = self.query_chaincode("GetEvidenceHistory", [ev_id])
-        
-        if not isinstance(data, list) or len(data) == 0:
-            print("No history found or error.")
-            return
-        
-        print(f"\n{'='*70}")
-        print(f"  EVIDENCE HISTORY: {ev_id}")
-        print(f"{'='*70}")
-        
-        # History is in reverse chronological order (newest first)
-        for i, item in enumerate(data):
-            evidence = item.get('evidence', {})
-            is_delete = item.get('isDelete', False)
-            ts_raw = item.get('timestamp', {})
-            tx_id = item.get('txId', 'N/A')
-            
-            # Format timestamp
-            if isinstance(ts_raw, dict):
-                seconds = ts_raw.get('seconds', 0)
-                dt = datetime.datetime.fromtimestamp(seconds)
-                formatted_time = dt.strftime('%Y-%m-%d %H:%M:%S')
-            else:
-                formatted_time = str(ts_raw)
-            
-            # Determine action
-            if is_delete:
-                action = "DELETED"
-            else:
-                created_at = evidence.get('created_at', '')
-                updated_at = evidence.get('updated_at', '')
+        # Pages are fetched as the loop reaches them; each record is rendered into one buffer and written as it arrives
+        count = 0
+        try:
+            # History is in reverse chronological order (newest first)
+            for item in self._iter_history(ev_id):
+                if count:
+                    lines = [f"{'':^35}▲", f"{'':^35}│"]
+                else:
+                    lines = [f"\n{'='*70}", f"  EVIDENCE HISTORY: {ev_id}", f"{'='*70}"]
+                
+                evidence = item.get('evidence', {})
+                is_delete = item.get('isDelete', False)
+                ts_raw = item.get('timestamp', {})
+                tx_id = item.get('txId', 'N/A')
                 
-                if created_at == updated_at:
-                    action = "CREATED"
+                # Format timestamp
+                if isinstance(ts_raw, dict):
+                    seconds = ts_raw.get('seconds', 0)
+                    dt = datetime.datetime.fromtimestamp(seconds)
+                    formatted_time = dt.strftime('%Y-%m-%d %H:%M:%S')
                 else:
-                    # Check if owner changed compared to previous state (next item in list)
-                    current_owner = evidence.get('owner', '')
-                    prev_owner = None
-                    
-                    # Look at the next item (older record) to compare owner
-                    if i + 1 < len(data):
-                        prev_evidence = data[i + 1].get('evidence', {})
-                        prev_owner = prev_evidence.get('owner', '')
+                    formatted_time = str(ts_raw)
+                
+                # Determine action
+                action = item.get('action', 'UPDATED')
+                
+                # Print formatted block
+                lines.append(f"\n  ┌{BOX_HR}┐")
+                lines.append(f"  │ {action:^64} │")
+                lines.append(f"  ├{BOX_HR}┤")
+                lines.append(f"  │ {'Timestamp:':<12} {formatted_time:<52} │")
+                lines.append(f"  │ {'TX ID:':<12} {tx_id[:52]:<52} │")
+                
+                if not is_delete:
+                    desc = _field(evidence, 'description')
+                    owner = evidence.get('owner', 'N/A')
+                    location = _field(evidence, 'location')
+                    status = evidence.get('status', 'N/A')
+                    tags = evidence.get('tags', [])
+                    tags_str = _trunc(', '.join(tags) if tags else 'None')
                     
-                    if prev_owner is not None and current_owner != prev_owner:
-                        action = "TRANSFERRED"
-                    else:
-                        action = "UPDATED"
-            
-            # Print formatted block
-            print(f"\n  ┌{'─'*66}┐")
-            print(f"  │ {action:^64} │")
-            print(f"  ├{'─'*66}┤")
-            print(f"  │ {'Timestamp:':<12} {formatted_time:<52} │")
-            print(f"  │ {'TX ID:':<12} {tx_id[:52]:<52} │")
-            
-            if not is_delete:
-                desc = evidence.get('description', 'N/A')
-                if len(desc) > 50: desc = desc[:47] + "..."
-                owner = evidence.get('owner', 'N/A')
-                location = evidence.get('location', 'N/A')
-                if len(location) > 50: location = location[:47] + "..."
-                status = evidence.get('status', 'N/A')
-                tags = evidence.get('tags', [])
-                tags_str = ', '.join(tags) if tags else 'None'
-                if len(tags_str) > 50: tags_str = tags_str[:47] + "..."
+                    lines.append(f"  ├{BOX_HR}┤")
+                    lines.append(f"  │ {'Owner:':<12} {owner:<52} │")
+                    lines.append(f"  │ {'Description:':<12} {desc:<52} │")
+                    lines.append(f"  │ {'Location:':<12} {location:<52} │")
+                    lines.append(f"  │ {'Status:':<12} {status:<52} │")
+                    lines.append(f"  │ {'Tags:':<12} {tags_str:<52} │")
                 
-                print(f"  ├{'─'*66}┤")
-                print(f"  │ {'Owner:':<12} {owner:<52} │")
-                print(f"  │ {'Description:':<12} {desc:<52} │")
-                print(f"  │ {'Location:':<12} {location:<52} │")
-                print(f"  │ {'Status:':<12} {status:<52} │")
-                print(f"  │ {'Tags:':<12} {tags_str:<52} │")
-            
-            print(f"  └{'─'*66}┘")
-            
-            # Draw arrow to next record (if not last)
-            if i < len(data) - 1:
-                print(f"{'':^35}▲")
-                print(f"{'':^35}│")
+                lines.append(f"  └{BOX_HR}┘")
+                
+                count += 1
+                sys.stdout.write("\n".join(lines) + "\n")
+        except PeerError as e:
+            print(f"Failed: {e}")
+            return
         
-        print(f"\n{'='*70}")
-        print(f"  Total Records: {len(data)}")
-        print(f"{'='*70}")
+        if not count:
+            print("No history found or error.")
+            return
+        
+        sys.stdout.write(f"\n{'='*70}\n  Total Records: {count}\n{'='*70}\n")
+        sys.stdout.flush()
+
+    def prefetch_all_evidence(self):
+        # Overlaps the GetAllEvidence round trip with the time the user spends at the prompt.
+        # A separate process rather than a pool thread, so exiting never waits on it and discarding it is a kill.
+        if self._all_evidence_proc is None:
+            try:
+                proc = subprocess.Popen(
+                    self._query_args("GetAllEvidence", []), env=self.env,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=False
+                )
+            except OSError:
+                return
+            self._all_evidence_proc = (self._generation, proc)
+
+    def discard_prefetch(self):
+        prefetched, self._all_evidence_proc = self._all_evidence_proc, None
+        if prefetched is not None:
+            prefetched[1].kill()
+            prefetched[1].communicate()
+
+    def _iter_prefetched(self, proc: subprocess.Popen) -> Iterator[Dict]:
+        # Array elements are parsed off the pipe as the peer writes them, so memory stays flat for
+        # large ledgers; without ijson the output is read whole. A non-zero exit raises PeerError at the end.
+        if ijson is None:
+            stdout, stderr = proc.communicate()
+        else:
+            try:
+                yield from ijson.items(proc.stdout, "item", use_float=True)
+            except ijson.JSONError:
+                pass
+            stdout, stderr = None, proc.communicate()[1]
+        if proc.returncode != 0:
+            raise self._peer_error(stderr, f"peer exited with status {proc.returncode}")
+        if stdout is not None:
+            data = self._parse_query_output(stdout)
+            yield from data if isinstance(data, list) else []
 
     def get_all(self):
-        data = self.query_chaincode("GetAllEvidence", [])
-        if isinstance(data, list):
-            for item in data: print(f"[{item.get('id')}] {item.get('description')}")
-        else: print("No evidence found.")
+        prefetched = self._all_evidence_proc
+        found = False
+        try:
+            if prefetched is not None and prefetched[0] == self._generation:
+                self._all_evidence_proc = None
+                items = self._iter_prefetched(prefetched[1])
+            else:
+                self.discard_prefetch()
+                data = self._query("GetAllEvidence", [])
+                items = data if isinstance(data, list) else []
+            for item in items:
+                found = True
+                print(f"[{item.get('id')}] {item.get('description')}")
+        except PeerError as e:
+            print(f"Failed: {e}")
+            return
+        if not found: print("No evidence found.")
 
     def delete_evidence(self):
         ev_id = input("\n[DANGER] ID to DELETE: ").strip()
         if input(f"Delete {ev_id}? (y/n): ").lower() == 'y':
             result = self.invoke_transaction("DeleteEvidence", [ev_id])
-            print("Deleted." if result["success"] else f"Failed: {result['error']}")
+            self._print_result(result, "Deleted.")
 
-    def view_blockchain_ledger(self):
-        print(f"\n{'='*70}")
-        print(f"  BLOCKCHAIN LEDGER ({self.friendly_name})")
-        print(f"{'='*70}")
-        print("  Fetching all transactions... this might take a moment...")
-        
+    def _collect_ledger(self) -> Tuple[List[Dict], int]:
+        # Every history record across all evidence, oldest first, plus the number of evidence IDs; raises PeerError
         # 1. Get all evidence IDs (including deleted ones)
-        all_evidence_ids = self.query_chaincode("GetAllEvidenceIDs", [])
+        all_evidence_ids = self._query("GetAllEvidenceIDs", [])
         if not all_evidence_ids:
-            print("  No evidence found on the ledger.")
-            return
+            return [], 0
 
         all_txs = []
-        
-        # 2. For each evidence ID, get its history
-        for ev_id in all_evidence_ids:
-            if not ev_id: continue
-            
-            history = self.query_chaincode("GetEvidenceHistory", [ev_id])
+
+        # 2. Get the history of every evidence ID
+        ev_ids = [ev_id for ev_id in all_evidence_ids if ev_id]
+        histories = self._get_histories(ev_ids)
+
+        for ev_id, history in zip(ev_ids, histories):
             if history:
-                for idx, record in enumerate(history):
-                    record['asset_id'] = ev_id
-                    # Store the previous record's owner for action detection
-                    if idx + 1 < len(history):
-                        record['prev_owner'] = history[idx + 1].get('evidence', {}).get('owner', '')
-                    else:
-                        record['prev_owner'] = None
-                    all_txs.append(record)
+                for record in history:
+                    # Annotated copy: the record itself belongs to the query cache.
+                    # Numeric sort key, so the sort below needs no Python-level key function
+                    ts = record.get('timestamp')
+                    all_txs.append(dict(
+                        record,
+                        asset_id=ev_id,
+                        _sort_ts=ts.get('seconds', 0) + ts.get('nanos', 0) / 1e9 if isinstance(ts, dict) else 0.0,
+                    ))
         
         # 3. Sort by timestamp (oldest first for ledger view)
-        def get_sort_key(tx):
-            ts = tx.get('timestamp')
-            if isinstance(ts, dict):
-                return ts.get('seconds', 0) + ts.get('nanos', 0) / 1e9
-            return ts or ""
+        all_txs.sort(key=operator.itemgetter('_sort_ts'))
+        return all_txs, len(all_evidence_ids)
 
-        all_txs.sort(key=get_sort_key)
+    def view_blockchain_ledger(self):
+        print(f"\n{'='*70}")
+        print(f"  BLOCKCHAIN LEDGER ({self.friendly_name})")
+        print(f"{'='*70}")
+        print("  Fetching all transactions... this might take a moment...")
+
+        # Block 0 is fetched and decoded on the shared pool while the evidence histories are gathered
+        genesis_future = _EXECUTOR.submit(self.get_genesis_block) if self._genesis_info is None else None
+        
+        # Rebuilt only when the channel height has moved since the last view
+        height = self._ledger_height()
+        if height is not None and self._ledger_cache is not None and self._ledger_cache[0] == height:
+            all_txs, asset_count = self._ledger_cache[1], self._ledger_cache[2]
+        else:
+            # Collect from uncached queries so the snapshot is at least as new as the height it is stored under
+            self._cache.clear()
+            try:
+                all_txs, asset_count = self._collect_ledger()
+            except PeerError as e:
+                print(f"  Failed: {e}")
+                return
+            self._ledger_cache = (height, all_txs, asset_count) if height is not None else None
+
+        if not asset_count:
+            print("  No evidence found on the ledger.")
+            return
 
         if not all_txs:
             print("  No transactions found.")
             return
 
-        print(f"\n  Found {len(all_txs)} transactions across {len(all_evidence_ids)} assets.")
+        # Rendered into one buffer and written once rather than a print() per line
+        lines = []
+        lines.append(f"\n  Found {len(all_txs)} transactions across {asset_count} assets.")
         
         # Fetch real genesis block info
-        genesis_info = self.get_genesis_block()
+        if genesis_future is not None:
+            genesis_info = genesis_future.result()
+            if genesis_info.get('hash', 'N/A') != 'N/A':
+                self._genesis_info = genesis_info
+        else:
+            genesis_info = self._genesis_info
         genesis_hash = genesis_info.get('hash', 'N/A')
         
         # If genesis hash failed, use a placeholder
@@ -413,13 +786,13 @@ class ChainOfCustodyClient:
             genesis_hash = "0" * 56
 
         # Print Genesis Block
-        print(f"\n  ┌{'─'*66}┐")
-        print(f"  │ {'GENESIS BLOCK':^64} │")
-        print(f"  ├{'─'*66}┤")
-        print(f"  │ {'Timestamp:':<12} {genesis_info.get('timestamp', 'N/A'):<52} │")
-        print(f"  │ {'Data Hash:':<12} {genesis_hash[:52]:<52} │")
-        print(f"  │ {'Prev Hash:':<12} {'0'*52:<52} │")
-        print(f"  └{'─'*66}┘")
+        lines.append(f"\n  ┌{BOX_HR}┐")
+        lines.append(f"  │ {'GENESIS BLOCK':^64} │")
+        lines.append(f"  ├{BOX_HR}┤")
+        lines.append(f"  │ {'Timestamp:':<12} {genesis_info.get('timestamp', 'N/A'):<52} │")
+        lines.append(f"  │ {'Data Hash:':<12} {genesis_hash[:52]:<52} │")
+        lines.append(f"  │ {'Prev Hash:':<12} {ZERO_HASH} │")
+        lines.append(f"  └{BOX_HR}┘")
         
         prev_hash = genesis_hash
 
@@ -438,64 +811,67 @@ class ChainOfCustodyClient:
             asset_id = tx.get('asset_id', 'N/A')
             is_delete = tx.get('isDelete', False)
             evidence = tx.get('evidence', {})
-            prev_owner = tx.get('prev_owner')
             
             # Determine action
-            if is_delete:
-                action = "DELETED"
-            else:
-                created_at = evidence.get('created_at', '')
-                updated_at = evidence.get('updated_at', '')
-                
-                if created_at == updated_at:
-                    action = "CREATED"
-                else:
-                    current_owner = evidence.get('owner', '')
-                    if prev_owner is not None and current_owner != prev_owner:
-                        action = "TRANSFERRED"
-                    else:
-                        action = "UPDATED"
+            action = tx.get('action', 'UPDATED')
             
             # Draw link arrow
-            print(f"{'':^35}│")
-            print(f"{'':^35}▼")
+            lines.append(f"{'':^35}│")
+            lines.append(f"{'':^35}▼")
             
             # Print transaction block
-            print(f"\n  ┌{'─'*66}┐")
-            print(f"  │ {action:^64} │")
-            print(f"  ├{'─'*66}┤")
-            print(f"  │ {'Timestamp:':<12} {formatted_time:<52} │")
-            print(f"  │ {'TX ID:':<12} {tx_id[:52]:<52} │")
-            print(f"  │ {'Prev Hash:':<12} {prev_hash[:52]:<52} │")
-            print(f"  │ {'Evidence ID:':<12} {asset_id[:52]:<52} │")
+            lines.append(f"\n  ┌{BOX_HR}┐")
+            lines.append(f"  │ {action:^64} │")
+            lines.append(f"  ├{BOX_HR}┤")
+            lines.append(f"  │ {'Timestamp:':<12} {formatted_time:<52} │")
+            lines.append(f"  │ {'TX ID:':<12} {tx_id[:52]:<52} │")
+            lines.append(f"  │ {'Prev Hash:':<12} {prev_hash[:52]:<52} │")
+            lines.append(f"  │ {'Evidence ID:':<12} {asset_id[:52]:<52} │")
             
             if not is_delete:
-                desc = evidence.get('description', 'N/A')
-                if len(desc) > 50: desc = desc[:47] + "..."
+                desc = _field(evidence, 'description')
                 owner = evidence.get('owner', 'N/A')
-                location = evidence.get('location', 'N/A')
-                if len(location) > 50: location = location[:47] + "..."
+                location = _field(evidence, 'location')
                 status = evidence.get('status', 'N/A')
                 
-                print(f"  ├{'─'*66}┤")
-                print(f"  │ {'Owner:':<12} {owner:<52} │")
-                print(f"  │ {'Description:':<12} {desc:<52} │")
-                print(f"  │ {'Location:':<12} {location:<52} │")
-                print(f"  │ {'Status:':<12} {status:<52} │")
+                lines.append(f"  ├{BOX_HR}┤")
+                lines.append(f"  │ {'Owner:':<12} {owner:<52} │")
+                lines.append(f"  │ {'Description:':<12} {desc:<52} │")
+                lines.append(f"  │ {'Location:':<12} {location:<52} │")
+                lines.append(f"  │ {'Status:':<12} {status:<52} │")
             
-            print(f"  └{'─'*66}┘")
+            lines.append(f"  └{BOX_HR}┘")
             
             # Update prev_hash for the next link
             prev_hash = tx_id
         
-        print(f"\n{'='*70}")
-        print(f"  Total Transactions: {len(all_txs)}")
-        print(f"{'='*70}")
+        lines.append(f"\n{'='*70}")
+        lines.append(f"  Total Transactions: {len(all_txs)}")
+        lines.append(f"{'='*70}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+# Menu selection -> client action; "0" (exit) is handled in main()
+_MENU = {
+    "1": ChainOfCustodyClient.create_evidence,
+    "2": ChainOfCustodyClient.read_evidence,
+    "3": ChainOfCustodyClient.update_evidence,
+    "4": ChainOfCustodyClient.transfer_custody,
+    "5": ChainOfCustodyClient.get_history,
+    "6": ChainOfCustodyClient.get_all,
+    "7": ChainOfCustodyClient.delete_evidence,
+    "8": ChainOfCustodyClient.view_blockchain_ledger,
+    "9": ChainOfCustodyClient.bulk_import_csv,
+}
 
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stderr)
+    if os.name == 'nt':
+        os.system('')  # enables VT escape processing in the Windows console
     clear_screen()
     print("Welcome to the Secure Evidence Ledger.")
 
@@ -559,33 +935,47 @@ def main():
         print(f"Error initializing client: {e}")
         sys.exit(1)
 
+    if "--tune" in sys.argv[1:]:
+        print("Tuning orderer batch timeout...")
+        result = client.tune_orderer()
+        if not result["success"]:
+            print(f"Orderer tuning failed: {result['error']}")
+        elif result["changed"]:
+            print(f"Orderer BatchTimeout lowered from {result['previous']}.")
+        else:
+            print("Orderer already tuned.")
+        time.sleep(1)
+
+    banner = (
+        "=" * 60 + "\n"
+        f"  USER: {client.username} | ORG: {client.friendly_name.upper()}\n"
+        + "=" * 60 + "\n"
+        "  1. Create Evidence\n"
+        "  2. Read Evidence\n"
+        "  3. Update Evidence\n"
+        "  4. Transfer Custody\n"
+        "  5. History\n"
+        "  6. Get All\n"
+        "  7. Delete\n"
+        "  8. View Blockchain Ledger\n"
+        "  9. Bulk Import from CSV\n"
+        "  0. Exit\n"
+        "\n"
+    )
 
     while True:
+        client.prefetch_all_evidence()
         clear_screen()
-        print("="*60)
-        print(f"  USER: {client.username} | ORG: {client.friendly_name.upper()}")
-        print("="*60)
-        print("  1. Create Evidence")
-        print("  2. Read Evidence")
-        print("  3. Update Evidence")
-        print("  4. Transfer Custody")
-        print("  5. History")
-        print("  6. Get All")
-        print("  7. Delete")
-        print("  8. View Blockchain Ledger")
-        print("  0. Exit")
-        print()
+        sys.stdout.write(banner)
+        sys.stdout.flush()
         
         choice = input("Select > ").strip().lower()
+        if choice != "6":
+            # Kept only for an immediate "Get All"; after any other action it would be stale
+            client.discard_prefetch()
         
-        if choice == "1": client.create_evidence()
-        elif choice == "2": client.read_evidence()
-        elif choice == "3": client.update_evidence()
-        elif choice == "4": client.transfer_custody()
-        elif choice == "5": client.get_history()
-        elif choice == "6": client.get_all()
-        elif choice == "7": client.delete_evidence()
-        elif choice == "8": client.view_blockchain_ledger()
+        action = _MENU.get(choice)
+        if action is not None: action(client)
         elif choice == "0": sys.exit(0)
         else: print("Invalid choice.")
         